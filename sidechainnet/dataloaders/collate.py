@@ -42,6 +42,8 @@ def get_collate_fn(aggregate_input, seqs_as_onehot=None):
         raise ValueError("Sequences must be represented as one-hot vectors if model input"
                          " is to be aggregated.")
 
+    dssp_vocab = DSSPVocabulary()
+
     def collate_fn(insts):
         """Collates items extracted from a ProteinDataset, returning all items separately.
 
@@ -64,26 +66,16 @@ def get_collate_fn(aggregate_input, seqs_as_onehot=None):
         lengths = tuple(len(s) for s in sequences)
         max_batch_len = max(lengths)
 
-        int_seqs = pad_for_batch(sequences,
-                                 max_batch_len,
-                                 'seq',
-                                 seqs_as_onehot=False,
-                                 vocab=VOCAB)
-        padded_seqs = pad_for_batch(sequences,
-                                    max_batch_len,
-                                    'seq',
-                                    seqs_as_onehot=seqs_as_onehot,
-                                    vocab=VOCAB)
-        padded_secs = pad_for_batch(secs,
-                                    max_batch_len,
-                                    'seq',
-                                    seqs_as_onehot=seqs_as_onehot,
-                                    vocab=DSSPVocabulary())
-        padded_msks = pad_for_batch(masks, max_batch_len, 'msk')
-        padded_pssms = pad_for_batch(pssms, max_batch_len, 'pssm')
-        padded_angs = pad_for_batch(angles, max_batch_len, 'ang')
-        padded_crds = pad_for_batch(coords, max_batch_len, 'crd')
-        padded_mods = pad_for_batch(mods, max_batch_len, 'msk')
+        int_seqs = _pad_seqs(sequences, max_batch_len, VOCAB.pad_id)
+        padded_seqs = _seqs_to_onehot(int_seqs, VOCAB) if seqs_as_onehot else int_seqs
+        padded_secs = _pad_seqs(secs, max_batch_len, dssp_vocab.pad_id)
+        if seqs_as_onehot:
+            padded_secs = _seqs_to_onehot(padded_secs, dssp_vocab)
+        padded_msks = _pad_msks(masks, max_batch_len)
+        padded_pssms = _pad_features(pssms, max_batch_len)
+        padded_angs = _pad_features(angles, max_batch_len)
+        padded_crds = _pad_crds(coords, max_batch_len)
+        padded_mods = _pad_msks(mods, max_batch_len)
 
         # Non-aggregated model input
         if not aggregate_input:
@@ -142,57 +134,75 @@ def pad_for_batch(items, batch_length, dtype="", seqs_as_onehot=False, vocab=Non
     Returns:
          A padded list of the input items, all independently converted to Torch tensors.
     """
-    batch = []
     if dtype == "seq":
-        # Sequences are padded with a specific VOCAB pad character
-        for seq in items:
-            z = np.ones((batch_length - len(seq))) * vocab.pad_id
-            c = np.concatenate((seq, z), axis=0)
-            batch.append(c)
-        batch = np.array(batch)
-        batch = batch[:, :MAX_SEQ_LEN]
-        batch = torch.LongTensor(batch)
+        batch = _pad_seqs(items, batch_length, vocab.pad_id)
         if seqs_as_onehot:
-            batch = torch.nn.functional.one_hot(batch, len(vocab))
-            if vocab.include_pad_char:
-                # Delete the column for the pad character since it is implied (0-vector)
-                if len(batch.shape) == 3:
-                    batch = batch[:, :, :-1]
-                elif len(batch.shape) == 2:
-                    batch = batch[:, :-1]
-                else:
-                    raise ValueError(f"Unexpected batch dimension {str(batch.shape)}.")
+            batch = _seqs_to_onehot(batch, vocab)
+        return batch
     elif dtype == "msk":
-        # Mask sequences (1 if present, 0 if absent) are padded with 0s
-        for msk in items:
-            z = np.zeros((batch_length - len(msk)))
-            c = np.concatenate((msk, z), axis=0)
-            batch.append(c)
-        batch = np.array(batch)
-        batch = batch[:, :MAX_SEQ_LEN]
-        batch = torch.LongTensor(batch)
+        return _pad_msks(items, batch_length)
     elif dtype in ["pssm", "ang"]:
-        # Mask other features with 0-vectors of a matching shape
-        for item in items:
-            z = np.zeros((batch_length - len(item), item.shape[-1]))
-            c = np.concatenate((item, z), axis=0)
-            batch.append(c)
-        batch = np.array(batch)
-        batch = batch[:, :MAX_SEQ_LEN]
-        batch = torch.FloatTensor(batch)
+        return _pad_features(items, batch_length)
     elif dtype == "crd":
-        for item in items:
-            z = np.zeros((batch_length * NUM_COORDS_PER_RES - len(item), item.shape[-1]))
-            c = np.concatenate((item, z), axis=0)
-            batch.append(c)
-        batch = np.array(batch)
-        # There are multiple rows per res, so we allow the coord matrix to be larger
-        batch = batch[:, :MAX_SEQ_LEN * NUM_COORDS_PER_RES]
-        batch = torch.FloatTensor(batch)
-
+        return _pad_crds(items, batch_length)
+    return []
+
+
+def _pad_seqs(items, batch_length, pad_id):
+    """Pad integer sequences with pad_id, returning a LongTensor."""
+    length = min(batch_length, MAX_SEQ_LEN)
+    batch = np.full((len(items), length), pad_id, dtype=np.int64)
+    for i, seq in enumerate(items):
+        seq = seq[:length]
+        batch[i, :len(seq)] = seq
+    return torch.from_numpy(batch)
+
+
+def _seqs_to_onehot(batch, vocab):
+    """Convert a padded integer sequence batch into one-hot vectors."""
+    batch = torch.nn.functional.one_hot(batch, len(vocab))
+    if vocab.include_pad_char:
+        # Delete the column for the pad character since it is implied (0-vector)
+        if len(batch.shape) == 3:
+            batch = batch[:, :, :-1]
+        elif len(batch.shape) == 2:
+            batch = batch[:, :-1]
+        else:
+            raise ValueError(f"Unexpected batch dimension {str(batch.shape)}.")
     return batch
 
 
+def _pad_msks(items, batch_length):
+    """Pad mask sequences (1 if present, 0 if absent) with 0s, returning a LongTensor."""
+    length = min(batch_length, MAX_SEQ_LEN)
+    batch = np.zeros((len(items), length), dtype=np.int64)
+    for i, msk in enumerate(items):
+        msk = msk[:length]
+        batch[i, :len(msk)] = msk
+    return torch.from_numpy(batch)
+
+
+def _pad_features(items, batch_length):
+    """Pad per-residue features (pssms, angles) with 0-vectors of a matching shape."""
+    length = min(batch_length, MAX_SEQ_LEN)
+    batch = np.zeros((len(items), length, items[0].shape[-1]), dtype=np.float32)
+    for i, item in enumerate(items):
+        item = item[:length]
+        batch[i, :len(item)] = item
+    return torch.from_numpy(batch)
+
+
+def _pad_crds(items, batch_length):
+    """Pad coordinates, which have NUM_COORDS_PER_RES rows per residue, with 0s."""
+    # There are multiple rows per res, so we allow the coord matrix to be larger
+    length = min(batch_length, MAX_SEQ_LEN) * NUM_COORDS_PER_RES
+    batch = np.zeros((len(items), length, items[0].shape[-1]), dtype=np.float32)
+    for i, item in enumerate(items):
+        item = item[:length]
+        batch[i, :len(item)] = item
+    return torch.from_numpy(batch)
+
+
 def prepare_dataloaders(data,
                         aggregate_model_input,
                         collate_fn=None,
@@ -217,17 +227,30 @@ def prepare_dataloaders(data,
             PyTorch DataLoader. If False, this expands the model_input variable into
             its components (sequence, mask pssm).
         batch_size: Batch size to use when yielding batches from a DataLoader.
+        num_workers: Number of worker processes per DataLoader. If greater than 0, the
+            workers of the train and train-eval loaders persist across epochs. The
+            validation and test loaders, which are iterated less often, start their
+            workers on each pass.
     """
     from sidechainnet.utils.download import VALID_SPLITS
     if collate_fn is None:
         collate_fn = get_collate_fn(aggregate_model_input, seqs_as_onehot=seq_as_onehot)
 
+    loader_kwargs = {
+        'num_workers': num_workers,
+        'collate_fn': collate_fn,
+        'pin_memory': torch.cuda.is_available()
+    }
+    train_loader_kwargs = dict(loader_kwargs)
+    if num_workers > 0:
+        # Keep the training workers alive across epochs instead of respawning them
+        train_loader_kwargs.update(persistent_workers=True, prefetch_factor=4)
+
     train_dataset = ProteinDataset(data['train'], 'train', data['settings'], data['date'])
 
     train_loader = torch.utils.data.DataLoader(
         train_dataset,
-        num_workers=num_workers,
-        collate_fn=collate_fn,
+        **train_loader_kwargs,
         batch_sampler=SimilarLengthBatchSampler(
             train_dataset,
             batch_size,
@@ -238,8 +261,7 @@ def prepare_dataloaders(data,
 
     train_eval_loader = torch.utils.data.DataLoader(
         train_dataset,
-        num_workers=num_workers,
-        collate_fn=collate_fn,
+        **train_loader_kwargs,
         batch_sampler=SimilarLengthBatchSampler(
             train_dataset,
             batch_size,
@@ -251,17 +273,15 @@ def prepare_dataloaders(data,
     for vsplit in VALID_SPLITS:
         valid_loader = torch.utils.data.DataLoader(ProteinDataset(
             data[vsplit], vsplit, data['settings'], data['date']),
-                                                   num_workers=num_workers,
                                                    batch_size=batch_size,
-                                                   collate_fn=collate_fn)
+                                                   **loader_kwargs)
         valid_loaders[vsplit] = valid_loader
 
     test_loader = torch.utils.data.DataLoader(ProteinDataset(data['test'], 'test',
                                                              data['settings'],
                                                              data['date']),
-                                              num_workers=num_workers,
                                               batch_size=batch_size,
-                                              collate_fn=collate_fn)
+                                              **loader_kwargs)
 
     dataloaders = {
         'train': train_loader,
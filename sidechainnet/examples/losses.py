@@ -1,10 +1,10 @@
 """Losses for training."""
 
-import numpy as np
 import prody as pr
 import torch
 
 from sidechainnet.structure.build_info import NUM_COORDS_PER_RES
+from sidechainnet.utils.sequence import VOCAB
 
 
 def compute_batch_drmsd(true_coordinates, pred_coordinates, seq, verbose=False):
@@ -21,22 +21,27 @@ def compute_batch_drmsd(true_coordinates, pred_coordinates, seq, verbose=False):
             computed. Defaults to False.
 
     Returns:
-        torch.Tensor: Geometric mean of DRMSD values for each protein in the batch.
-            Lower is better.
+        torch.Tensor: Mean of the length-normalized DRMSD (lnDRMSD) values for each
+            protein in the batch. Lower is better.
     """
-    drmsds = torch.tensor(0.0)
-    raw_drmsds = torch.tensor(0.0)
-    for pc, tc, s in zip(pred_coordinates, true_coordinates, seq):
-        # Remove batch_padding from true coords
-        batch_padding = _tile((s != 20), 0, NUM_COORDS_PER_RES)
-        tc = tc[batch_padding]
-        missing_atoms = (tc == 0).all(axis=-1)
-        tc = tc[~missing_atoms]
-        pc = pc[~missing_atoms]
-
-        d = drmsd(tc, pc)
-        drmsds += d / (len(tc) // NUM_COORDS_PER_RES)
-        raw_drmsds += d
+    batch_size = true_coordinates.shape[0]
+    true_coordinates = true_coordinates.reshape(batch_size, -1, 3)
+    pred_coordinates = pred_coordinates.reshape(batch_size, -1, 3)
+
+    # Atoms are valid if they belong to a non-padding residue and are not missing
+    valid = (seq != VOCAB.pad_id).repeat_interleave(NUM_COORDS_PER_RES, dim=1)
+    valid &= ~(true_coordinates == 0).all(dim=-1)
+
+    # Compact the valid atoms of the whole batch at once, then compare each protein on
+    # its own atoms so that memory scales with that protein's length rather than with
+    # the longest protein in the batch
+    counts = valid.sum(dim=1).tolist()
+    true_per_protein = torch.split(true_coordinates[valid], counts)
+    pred_per_protein = torch.split(pred_coordinates[valid], counts)
+    raw_drmsds = torch.stack(
+        [_drmsd_sq(tc, pc) for tc, pc in zip(true_per_protein, pred_per_protein)]).sqrt()
+    drmsds = raw_drmsds / torch.tensor([c // NUM_COORDS_PER_RES for c in counts],
+                                       device=raw_drmsds.device)
 
     if verbose:
         print(f"DRMSD = {raw_drmsds.mean():.2f}, lnDRMSD = {drmsds.mean():.2f}")
@@ -47,9 +52,9 @@ def drmsd(a, b):
     """Return distance root-mean-squared-deviation between tensors a and b.
 
     Given 2 coordinate tensors, returns the dRMSD between them. Both
-    tensors must be the exact same shape. It works by creating a mask of the
-    upper-triangular indices of the pairwise distance matrix (excluding the
-    diagonal). Then, the resulting values are compared with PyTorch's MSE loss.
+    tensors must be the exact same shape. The condensed (upper-triangular,
+    excluding the diagonal) pairwise distances of each tensor are computed with
+    torch.pdist and then compared with PyTorch's MSE loss.
 
     Args:
         a, b (torch.Tensor): coordinate tensor with shape (L x 3).
@@ -57,14 +62,13 @@ def drmsd(a, b):
     Returns:
         res (torch.Tensor): DRMSD between a and b.
     """
-    a_ = pairwise_internal_dist(a)
-    b_ = pairwise_internal_dist(b)
+    return _drmsd_sq(a, b).sqrt()
 
-    i = torch.triu_indices(a_.shape[0], a_.shape[1], offset=1)
-    mse = torch.nn.functional.mse_loss(a_[i[0], i[1]].float(), b_[i[0], i[1]].float())
-    res = torch.sqrt(mse)
 
-    return res
+def _drmsd_sq(a, b):
+    """Return the squared DRMSD (MSE of pairwise distances) between tensors a and b."""
+    a, b = a.float(), b.float()
+    return torch.nn.functional.mse_loss(torch.pdist(a), torch.pdist(b))
 
 
 def rmsd(a, b):
@@ -73,38 +77,26 @@ def rmsd(a, b):
     return pr.calcRMSD(t.apply(a), b)
 
 
-def pairwise_internal_dist(x):
+def pairwise_internal_dist(x, compute_mode='use_mm_for_euclid_dist_if_necessary'):
     """Return all pairwise distances between points in a coordinate tensor.
 
-    An implementation of cdist (pairwise distances between sets of vectors)
-    from user jacobrgardner on github. Not implemented for batches.
-    https://github.com/pytorch/pytorch/issues/15253
+    A thin wrapper around torch.cdist for comparing a set of points with itself. Not
+    implemented for batches.
+
+    Kept for backwards compatibility; drmsd no longer uses it and instead relies on
+    torch.pdist, which only computes the upper-triangular distances.
 
     Args:
         x (torch.Tensor): coordinate tensor with shape (L x 3)
+        compute_mode (str, optional): Passed to torch.cdist. By default, the matrix
+            multiplication approach is only used for larger inputs, and small inputs
+            use the more numerically stable direct computation.
 
     Returns:
         res (torch.Tensor): a distance tensor comparing all (L x L) pairs of
                             points
     """
-    x1, x2 = x, x
-    assert len(x1.shape) == 2, "Pairwise internal distance method is not " \
-                               "implemented for batches."
-    x1_norm = x1.pow(2).sum(
-        dim=-1,
-        keepdim=True)  # TODO: experiment with alternative to pow, remove duplicated norm
-    res = torch.addmm(x1_norm.transpose(-2, -1), x1, x2.transpose(-2, -1),
-                      alpha=-2).add_(x1_norm)
-    res = res.clamp_min_(1e-30).sqrt_()
-    return res
-
-
-def _tile(a, dim, n_tile):
-    # https://discuss.pytorch.org/t/how-to-tile-a-tensor/13853/4
-    init_dim = a.size(dim)
-    repeat_idx = [1] * a.dim()
-    repeat_idx[dim] = n_tile
-    a = a.repeat(*(repeat_idx))
-    order_index = torch.LongTensor(
-        np.concatenate([init_dim * np.arange(n_tile) + i for i in range(init_dim)]))
-    return torch.index_select(a, dim, order_index)
+    assert len(x.shape) == 2, "Pairwise internal distance method is not " \
+                              "implemented for batches."
+    x = x.unsqueeze(0)
+    return torch.cdist(x, x, compute_mode=compute_mode).squeeze(0)
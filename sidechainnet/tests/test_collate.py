@@ -0,0 +1,46 @@
+import numpy as np
+import torch
+
+from sidechainnet.dataloaders.collate import pad_for_batch
+from sidechainnet.structure.build_info import NUM_COORDS_PER_RES
+from sidechainnet.utils.sequence import VOCAB
+
+
+def test_pad_for_batch_seq():
+    seqs = [[1, 2, 3], [4]]
+    batch = pad_for_batch(seqs, 3, 'seq', vocab=VOCAB)
+    assert batch.dtype == torch.long
+    assert batch.tolist() == [[1, 2, 3], [4, VOCAB.pad_id, VOCAB.pad_id]]
+
+
+def test_pad_for_batch_msk():
+    msks = [[1, 0, 1], [1]]
+    batch = pad_for_batch(msks, 3, 'msk')
+    assert batch.dtype == torch.long
+    assert batch.tolist() == [[1, 0, 1], [1, 0, 0]]
+
+
+def test_pad_for_batch_ang():
+    angs = [np.ones((2, 12)), np.full((1, 12), 2.)]
+    batch = pad_for_batch(angs, 2, 'ang')
+    assert batch.dtype == torch.float32
+    assert batch.shape == (2, 2, 12)
+    assert (batch[1, 0] == 2).all() and (batch[1, 1] == 0).all()
+
+
+def test_pad_for_batch_crd():
+    crds = [np.ones((2 * NUM_COORDS_PER_RES, 3)), np.ones((NUM_COORDS_PER_RES, 3))]
+    batch = pad_for_batch(crds, 2, 'crd')
+    assert batch.dtype == torch.float32
+    assert batch.shape == (2, 2 * NUM_COORDS_PER_RES, 3)
+    assert batch[1, :NUM_COORDS_PER_RES].sum() == NUM_COORDS_PER_RES * 3
+    assert (batch[1, NUM_COORDS_PER_RES:] == 0).all()
+
+
+def test_pad_for_batch_trims_to_max_seq_len(monkeypatch):
+    monkeypatch.setattr("sidechainnet.dataloaders.collate.MAX_SEQ_LEN", 2)
+    seqs = [[1, 2, 3], [4]]
+    assert pad_for_batch(seqs, 3, 'seq', vocab=VOCAB).tolist() == [[1, 2],
+                                                                   [4, VOCAB.pad_id]]
+    crds = [np.ones((3 * NUM_COORDS_PER_RES, 3)), np.ones((NUM_COORDS_PER_RES, 3))]
+    assert pad_for_batch(crds, 3, 'crd').shape == (2, 2 * NUM_COORDS_PER_RES, 3)
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+import torch
+
+from sidechainnet.examples.losses import compute_batch_drmsd, drmsd, pairwise_internal_dist
+from sidechainnet.structure.build_info import NUM_COORDS_PER_RES
+from sidechainnet.utils.sequence import VOCAB
+
+
+MISSING_ATOMS = slice(5, 9)
+
+
+def _make_batch(lengths, max_len):
+    """Return a random, padded (true_crds, pred_crds, seq) batch with missing atoms."""
+    gen = torch.Generator().manual_seed(0)
+    seq = torch.full((len(lengths), max_len), VOCAB.pad_id, dtype=torch.long)
+    true_crds = torch.zeros(len(lengths), max_len * NUM_COORDS_PER_RES, 3)
+    pred_crds = torch.zeros(len(lengths), max_len * NUM_COORDS_PER_RES, 3)
+    for i, length in enumerate(lengths):
+        n_atoms = length * NUM_COORDS_PER_RES
+        seq[i, :length] = torch.randint(0, 20, (length,), generator=gen)
+        true_crds[i, :n_atoms] = torch.randn(n_atoms, 3, generator=gen) * 10
+        pred_crds[i, :n_atoms] = torch.randn(n_atoms, 3, generator=gen) * 10
+        true_crds[i, MISSING_ATOMS] = 0
+    return true_crds, pred_crds, seq
+
+
+def _reference_batch_drmsd(true_crds, pred_crds, lengths):
+    """Compute the mean lnDRMSD one protein at a time from the known lengths."""
+    total = 0
+    for tc, pc, length in zip(true_crds, pred_crds, lengths):
+        keep = torch.ones(length * NUM_COORDS_PER_RES, dtype=torch.bool)
+        keep[MISSING_ATOMS] = False
+        tc = tc[:length * NUM_COORDS_PER_RES][keep]
+        pc = pc[:length * NUM_COORDS_PER_RES][keep]
+        total += drmsd(tc, pc) / (len(tc) // NUM_COORDS_PER_RES)
+    return total / len(lengths)
+
+
+def test_compute_batch_drmsd_matches_per_protein():
+    lengths = [12, 7, 3]
+    true_crds, pred_crds, seq = _make_batch(lengths, 12)
+    expected = _reference_batch_drmsd(true_crds, pred_crds, lengths)
+    result = compute_batch_drmsd(true_crds, pred_crds, seq)
+    assert result.item() == pytest.approx(expected.item(), rel=1e-4)
+
+
+def test_compute_batch_drmsd_identical_structures():
+    true_crds, _, seq = _make_batch([10, 4], 10)
+    result = compute_batch_drmsd(true_crds, true_crds.clone(), seq)
+    assert result.item() == pytest.approx(0, abs=1e-5)
+
+
+def test_compute_batch_drmsd_realistic_lengths():
+    # One long chain padded together with short ones, as in the valid/test loaders
+    lengths = [500, 30, 30, 30]
+    true_crds, pred_crds, seq = _make_batch(lengths, max(lengths))
+    expected = _reference_batch_drmsd(true_crds, pred_crds, lengths)
+    result = compute_batch_drmsd(true_crds, pred_crds, seq)
+    assert result.item() == pytest.approx(expected.item(), rel=1e-4)
+
+
+@pytest.mark.parametrize("compute_mode",
+                         ["use_mm_for_euclid_dist", "donot_use_mm_for_euclid_dist"])
+def test_pairwise_internal_dist(compute_mode):
+    x = torch.randn(40, 3, generator=torch.Generator().manual_seed(0)) * 10
+    expected = ((x[:, None] - x[None])**2).sum(-1).sqrt()
+    result = pairwise_internal_dist(x, compute_mode=compute_mode)
+    assert result.shape == (40, 40)
+    # The matrix multiplication path is only accurate to round-off near zero distance,
+    # so the diagonal is compared separately
+    off_diag = ~torch.eye(40, dtype=torch.bool)
+    assert torch.allclose(result[off_diag], expected[off_diag], atol=1e-4)
+    if compute_mode == "donot_use_mm_for_euclid_dist":
+        assert (result.diagonal() == 0).all()
+
+
+def test_drmsd_hand_computed():
+    # Pairwise distances are (1, 2, sqrt(5)) for a and (2, 2, sqrt(8)) for b
+    a = torch.tensor([[0., 0., 0.], [1., 0., 0.], [0., 2., 0.]])
+    b = torch.tensor([[0., 0., 0.], [2., 0., 0.], [0., 2., 0.]])
+    expected = math.sqrt((1 + 0 + (math.sqrt(8) - math.sqrt(5))**2) / 3)
+    assert drmsd(a, b).item() == pytest.approx(expected, rel=1e-6)